@@ -20,6 +20,7 @@ FEATURES PRINCIPAIS:
 COMO USAR:
 1. Modo normal (processo completo):
    python selecao.py --nome "Nome do Candidato" [--expected_ratio 1.618] [--tolerancia 0.5] [--export_json]
+                     [--no_report] [--quiet] [--chart fpdf|mpl] [--in_memory] [--debug]
 
 2. Modo teste (validações):
    python selecao.py --testar
@@ -38,15 +39,20 @@ OBSERVAÇÕES:
 """
 
 import sqlite3
-import argparse
 import logging
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Iterator, TYPE_CHECKING
 from datetime import datetime
-import matplotlib.pyplot as plt
-from fpdf import FPDF
-from io import BytesIO
+from contextlib import contextmanager
+from itertools import repeat
 import json
 import time
+import numpy as np
+
+# matplotlib e fpdf são importados só onde são usados:
+# juntos somam mais de meio segundo de import, que --testar e a tela de ajuda não precisam
+if TYPE_CHECKING:
+    from fpdf import FPDF
+    from PIL import Image
 
 logging.basicConfig(
     # Define o nível mínimo de logs que será registrado (INFO inclui INFO, WARNING, ERROR, CRITICAL)
@@ -68,24 +74,110 @@ logging.basicConfig(
     ]
 )
 
+# Logger do módulo: as mensagens usam argumentos %s, formatados só se o nível estiver ativo
+log = logging.getLogger(__name__)
+
+# Maior termo da sequência que cabe em um inteiro de 64 bits (limite do INTEGER do SQLite)
+FIB_MAX_INT64 = 92
+
+def _build_fib_table() -> np.ndarray:
+    """Calcula uma única vez todos os termos de Fibonacci representáveis em 64 bits."""
+    table = np.empty(FIB_MAX_INT64, dtype=np.int64)
+    a, b = 0, 1
+    for i in range(FIB_MAX_INT64):
+        table[i] = b
+        a, b = b, a + b
+    table.setflags(write=False)  # Tabela compartilhada: só leitura
+    return table
+
+# F(1)..F(92) pré-calculados na importação (92 somas, microssegundos): como n nunca
+# passa de FIB_MAX_INT64, gerar a sequência é só copiar um prefixo desta tabela
+_FIB_TABLE = _build_fib_table()
+
 class DatabaseManager:
     """Gerencia todas as operações de banco de dados"""
+
+    # Comandos SQL reutilizados: o mesmo texto sempre garante acerto no cache de statements
+    _SQL_INSERT_CANDIDATE = "INSERT INTO SELECAO_CANDIDATO (NME_CANDIDATO) VALUES (?)"
+    _SQL_INSERT_TEST = (
+        "INSERT INTO SELECAO_TESTE (ID_CANDIDATO, NUM_FIBONACCI, NUM_PAR) VALUES (?, ?, ?)"
+    )
+    _SQL_DELETE_LARGE = "DELETE FROM SELECAO_TESTE WHERE NUM_FIBONACCI > ?"
+    _SQL_COUNTS = (
+        "SELECT COUNT(*), COUNT(*) FILTER (WHERE NUM_PAR = 1), COUNT(*) FILTER (WHERE NUM_IMPAR = 1) "
+        "FROM SELECAO_TESTE WHERE ID_CANDIDATO = ?"
+    )
+    _SQL_SEQUENCE = (
+        "SELECT NUM_FIBONACCI FROM SELECAO_TESTE WHERE ID_CANDIDATO = ? ORDER BY NUM_FIBONACCI"
+    )
+    _SQL_VALIDATE = (
+        "SELECT COUNT(*) FILTER (WHERE NUM_PAR NOT IN (0, 1)), "
+        "COUNT(*) FILTER (WHERE NUM_IMPAR NOT IN (0, 1)), "
+        "COUNT(*) FILTER (WHERE NUM_PAR = NUM_IMPAR), "
+        "COUNT(*) FILTER (WHERE NUM_FIBONACCI IS NULL) "
+        "FROM SELECAO_TESTE"
+    )
+    _SQL_ANY_INVALID = (
+        "SELECT EXISTS (SELECT 1 FROM SELECAO_TESTE WHERE NUM_PAR NOT IN (0, 1) "
+        "OR NUM_IMPAR NOT IN (0, 1) OR NUM_PAR = NUM_IMPAR OR NUM_FIBONACCI IS NULL)"
+    )
+    _SQL_CANDIDATE = (
+        "SELECT NME_CANDIDATO, DAT_INSCRICAO FROM SELECAO_CANDIDATO WHERE ID_CANDIDATO = ?"
+    )
     
-    def __init__(self, db_path: str = 'selecao.db'):
+    def __init__(self, db_path: str = 'selecao.db', debug: bool = False):
         """Inicializa a conexão com o banco de dados SQLite.
         
         Args:
             db_path (str): Caminho para o arquivo do banco de dados. 
                 Padrão: 'selecao.db' (banco criado no diretório atual)
+            debug (bool): Se True, imprime os registros inseridos em insert_tests
         """
+        self.debug = debug
         # Estabelece conexão com o banco de dados SQLite
-        self.conn = sqlite3.connect(db_path)
-        
-        # Cria um cursor para executar comandos SQL
-        self.cursor = self.conn.cursor()
+        # - cache de statements preparados ampliado do padrão 128 para 256
+        # - isolation_level=None: o driver não abre transações implícitas;
+        #   cada operação de escrita delimita a sua com _transaction()
+        self.conn = sqlite3.connect(db_path, cached_statements=256, isolation_level=None)
+
+        # Ajusta o SQLite para escrita rápida:
+        # - WAL evita a dupla gravação do rollback journal
+        # - synchronous=NORMAL dispensa o fsync a cada commit (seguro com WAL)
+        # - tabelas temporárias e cache de páginas (~20 MB) ficam em memória
+        # - leituras via mmap (até 256 MB) evitam cópias do arquivo para o cache
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-20000;
+            PRAGMA mmap_size=268435456;
+        """)
+
+        # Cache de get_stats: cada COMMIT incrementa a geração e cada linha alterada
+        # incrementa conn.total_changes; qualquer um dos dois invalida as entradas
+        self._write_generation = 0
+        self._stats_cache = {}  # candidate_id -> ((geração, total_changes), stats)
         
         # Registra no log que a conexão foi estabelecida
-        logging.info("Banco de dados conectado")
+        log.info("Banco de dados conectado")
+
+    @contextmanager
+    def _transaction(self):
+        """Executa o bloco em uma transação explícita (BEGIN IMMEDIATE ... COMMIT).
+        
+        Em caso de exceção faz ROLLBACK e propaga o erro para o método chamador.
+        """
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            # Alguns erros (SQLITE_FULL, SQLITE_IOERR, SQLITE_NOMEM...) já encerram a transação;
+            # um ROLLBACK sem transação ativa falharia e esconderia o erro original
+            if self.conn.in_transaction:
+                self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+        self._write_generation += 1
 
     def create_tables(self) -> bool:
         """Cria as tabelas necessárias no banco de dados.
@@ -94,39 +186,53 @@ class DatabaseManager:
             bool: True se as tabelas foram criadas com sucesso, False caso contrário
         """
         try:
-            # 1. LIMPEZA - Remove tabelas existentes para evitar conflitos
-            self.cursor.execute("DROP TABLE IF EXISTS SELECAO_TESTE")
-            self.cursor.execute("DROP TABLE IF EXISTS SELECAO_CANDIDATO")
-            
-            # 2. CRIAÇÃO DA TABELA DE CANDIDATOS
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS SELECAO_CANDIDATO (
-                ID_CANDIDATO INTEGER PRIMARY KEY AUTOINCREMENT,
-                NME_CANDIDATO TEXT NOT NULL,
-                DAT_INSCRICAO TIMESTAMP DEFAULT CURRENT_TIMESTAMP 
-            )
-            """)
-            
-            # 3. CRIAÇÃO DA TABELA DE TESTES (relacionada aos candidatos)
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS SELECAO_TESTE (
-                ID_TESTE INTEGER PRIMARY KEY AUTOINCREMENT,      
-                ID_CANDIDATO INTEGER,                            
-                NUM_FIBONACCI INTEGER NOT NULL,                  
-                NUM_PAR INTEGER CHECK (NUM_PAR IN (0, 1)) NOT NULL,  
-                NUM_IMPAR INTEGER CHECK (NUM_IMPAR IN (0, 1)) NOT NULL, 
-                FOREIGN KEY (ID_CANDIDATO) REFERENCES SELECAO_CANDIDATO(ID_CANDIDATO) 
-            )
-            """)
-            
-            # 4. CONFIRMA as alterações no banco
-            self.conn.commit()
-            logging.info("Tabelas criadas com sucesso")
+            # Todo o DDL em uma única transação: um só commit no journal
+            with self._transaction():
+                # 1. LIMPEZA - Remove tabelas existentes para evitar conflitos
+                self.conn.execute("DROP TABLE IF EXISTS SELECAO_TESTE")
+                self.conn.execute("DROP TABLE IF EXISTS SELECAO_CANDIDATO")
+
+                # 2. CRIAÇÃO DA TABELA DE CANDIDATOS
+                self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS SELECAO_CANDIDATO (
+                    ID_CANDIDATO INTEGER PRIMARY KEY AUTOINCREMENT,
+                    NME_CANDIDATO TEXT NOT NULL,
+                    DAT_INSCRICAO TIMESTAMP DEFAULT CURRENT_TIMESTAMP 
+                )
+                """)
+
+                # 3. CRIAÇÃO DA TABELA DE TESTES (relacionada aos candidatos)
+                self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS SELECAO_TESTE (
+                    ID_TESTE INTEGER PRIMARY KEY AUTOINCREMENT,      
+                    ID_CANDIDATO INTEGER,                            
+                    NUM_FIBONACCI INTEGER NOT NULL,                  
+                    NUM_PAR INTEGER CHECK (NUM_PAR IN (0, 1)) NOT NULL,  
+                    -- NUM_IMPAR é sempre o complemento de NUM_PAR: coluna virtual, calculada na leitura
+                    NUM_IMPAR INTEGER GENERATED ALWAYS AS (1 - NUM_PAR) VIRTUAL
+                        CHECK (NUM_IMPAR IN (0, 1)) NOT NULL,
+                    FOREIGN KEY (ID_CANDIDATO) REFERENCES SELECAO_CANDIDATO(ID_CANDIDATO) 
+                )
+                """)
+
+                # 4. ÍNDICES
+                # 4.1. Por candidato e número: as leituras por candidato fazem busca direta
+                #      e a sequência sai ordenada do próprio índice (covering, sem sort)
+                self.conn.execute(
+                    "CREATE INDEX IF NOT EXISTS IDX_TESTE_CAND_FIB ON SELECAO_TESTE(ID_CANDIDATO, NUM_FIBONACCI)"
+                )
+                # 4.2. Só pelo número: DELETE por faixa sem varredura completa
+                self.conn.execute(
+                    "CREATE INDEX IF NOT EXISTS IDX_TESTE_FIB ON SELECAO_TESTE(NUM_FIBONACCI)"
+                )
+
+            # 5. ALTERAÇÕES CONFIRMADAS pelo COMMIT ao sair do bloco acima
+            log.info("Tabelas criadas com sucesso")
             return True
             
         except sqlite3.Error as e:
-            # 5. TRATAMENTO DE ERRO - Registra falhas
-            logging.error(f"Erro na criação de tabelas: {e}")
+            # 6. TRATAMENTO DE ERRO - Registra falhas
+            log.error("Erro na criação de tabelas: %s", e)
             return False
         
     def insert_candidate(self, name: str) -> int:
@@ -144,55 +250,74 @@ class DatabaseManager:
         try:
             # 2. EXECUÇÃO DA QUERY SQL
             # UTILIZA PARAMETRIZAÇÃO PARA EVITAR SQL INJECTION
-            self.cursor.execute(
-                "INSERT INTO SELECAO_CANDIDATO (NME_CANDIDATO) VALUES (?)",
-                (name,)
-            )
-            
-            # 3. CONFIRMAÇÃO DA TRANSAÇÃO
-            self.conn.commit()
+            # 3. CONFIRMAÇÃO DA TRANSAÇÃO (COMMIT ao sair do bloco)
+            with self._transaction():
+                cursor = self.conn.execute(self._SQL_INSERT_CANDIDATE, (name,))
             
             # 4. REGISTRO DO LOG E RETORNO DO ID
-            logging.info(f"Candidato '{name}' inserido")
-            return self.cursor.lastrowid
+            log.info("Candidato '%s' inserido", name)
+            return cursor.lastrowid
             
         except sqlite3.Error as e:
             # 5. TRATAMENTO DE ERROS
             # REGISTRA ERRO NO LOG E RETORNA CÓDIGO DE FALHA
-            logging.error(f"Erro ao inserir candidato: {e}")
+            log.error("Erro ao inserir candidato: %s", e)
             return -1
     
-    def generate_fibonacci(self, n: int = 30) -> List[int]:
+    @staticmethod
+    def generate_fibonacci(n: int = 30) -> np.ndarray:
         """Gera e retorna a sequência de Fibonacci até o n-ésimo termo.
         
         Args:
-            n (int): Quantidade de números da sequência a gerar (padrão: 30)
+            n (int): Quantidade de números da sequência a gerar (padrão: 30, máximo: 92)
         
         Returns:
-            List[int]: Sequência de Fibonacci
+            np.ndarray: Sequência de Fibonacci (dtype int64)
+
+        Raises:
+            ValueError: Se n estiver fora do intervalo suportado por inteiros de 64 bits
         """
-        a, b = 0, 1
-        sequence = []
-        
-        # Gera cada número da sequência
-        for i in range(n):
-            sequence.append(b)
-            a, b = b, a + b
-        
-        # Formata e imprime a sequência conforme especificação
-        print("\n[SEQUÊNCIA FIBONACCI GERADA]")
-        for i, num in enumerate(sequence):
-            # Quebra de linha a cada 10 números para melhor visualização
-            end_char = "\n" if (i + 1) % 10 == 0 else ", "
-            # Último número não tem vírgula
-            if i == len(sequence) - 1:
-                print(num)
-            else:
-                print(num, end=end_char)
+        if not 0 <= n <= FIB_MAX_INT64:
+            raise ValueError(f"n deve estar entre 0 e {FIB_MAX_INT64}, recebido {n}")
+
+        # Copia o prefixo da tabela pré-calculada (cópia: o chamador pode alterar o array)
+        sequence = _FIB_TABLE[:n].copy()
+        
+        # Formata e imprime a sequência conforme especificação, em uma única escrita
+        # (10 números por linha, separados por vírgula; o último sem vírgula)
+        values = sequence.tolist()
+        lines = [", ".join(map(str, values[i:i + 10])) for i in range(0, len(values), 10)]
+        print("\n".join(["\n[SEQUÊNCIA FIBONACCI GERADA]"] + lines))
         
         return sequence
     
-    def insert_tests(self, candidate_id: int, fib_sequence: List[int]):
+    @staticmethod
+    def fib_single(n: int) -> int:
+        """Calcula apenas o n-ésimo termo de Fibonacci por fast doubling, em O(log n).
+        
+        Usa as identidades F(2k) = F(k) * (2F(k+1) - F(k)) e F(2k+1) = F(k)² + F(k+1)²,
+        percorrendo os bits de n. Como usa inteiros do Python, não há limite de 64 bits.
+        
+        Args:
+            n (int): Índice do termo desejado (F(0) = 0, F(1) = 1)
+        
+        Returns:
+            int: O termo F(n)
+        
+        Raises:
+            ValueError: Se n for negativo
+        """
+        if n < 0:
+            raise ValueError(f"n deve ser não negativo, recebido {n}")
+
+        a, b = 0, 1  # F(k), F(k+1) com k = 0
+        for bit in bin(n)[2:]:
+            c = a * (2 * b - a)  # F(2k)
+            d = a * a + b * b    # F(2k+1)
+            a, b = (d, c + d) if bit == '1' else (c, d)
+        return a
+
+    def insert_tests(self, candidate_id: int, fib_sequence: np.ndarray):
         """Insere uma sequência de testes Fibonacci na tabela SELECAO_TESTE.
         
         # 1. INICIALIZAÇÃO
@@ -200,52 +325,53 @@ class DatabaseManager:
         
         Args:
             candidate_id (int): ID do candidato associado aos testes
-            fib_sequence (List[int]): Lista de números da sequência Fibonacci a serem analisados
+            fib_sequence (np.ndarray | List[int]): Números da sequência Fibonacci a serem analisados
             
         Processo:
-            - Para cada número Fibonacci, calcula se é par ou ímpar
-            - Insere registro com metadados de análise
-            - Inclui extensos logs para debugging
+            - Calcula a paridade de todos os números de uma só vez (bitwise)
+            - Insere todos os registros com um único executemany
+            - Imprime amostra dos registros apenas com debug=True
         """
         try:
             # 2. DEBUG INICIAL
             # LOGS DETALHADOS PARA MONITORAMENTO DO PROCESSO
-            print(f"\n[DEBUG] Iniciando inserção de testes para candidato ID: {candidate_id}")
-            logging.debug(f" Tamanho da sequência: {len(fib_sequence)} números")
-            
+            log.debug(" Iniciando inserção de testes para candidato ID: %s", candidate_id)
+            log.debug(" Tamanho da sequência: %s números", len(fib_sequence))
+
             # 3. PROCESSAMENTO DA SEQUÊNCIA
-            for i, num in enumerate(fib_sequence):
-                # 3.1. ANÁLISE MATEMÁTICA
-                # CLASSIFICAÇÃO PAR/ÍMPAR COM OPERAÇÃO BITWISE (OTIMIZADO)
-                is_even = 1 if num % 2 == 0 else 0
-                is_odd = 1 - is_even
-                
-                # 3.2. DEBUG DOS VALORES (OPCIONAL)
-                logging.debug(f" Inserindo #{i+1}: Fib={num} | Par={is_even} | Ímpar={is_odd}")
-                
-                # 4. EXECUÇÃO DA QUERY
-                self.cursor.execute(
-                    """INSERT INTO SELECAO_TESTE 
-                    (ID_CANDIDATO, NUM_FIBONACCI, NUM_PAR, NUM_IMPAR) 
-                    VALUES (?, ?, ?, ?)""",
-                    (candidate_id, num, is_even, is_odd)
-                )
-                
-                # 5. DEBUG COMPLEMENTAR
-                # MOSTRA PRIMEIROS E ÚLTIMOS 5 REGISTROS PARA VERIFICAÇÃO
-                if i < 5 or i >= len(fib_sequence) - 5:
-                    print(f"  [SQL] INSERT INTO SELECAO_TESTE VALUES({candidate_id}, {num}, {is_even}, {is_odd})")
-            
+            # CLASSIFICAÇÃO PAR/ÍMPAR VETORIZADA: fib & 1 é o bit ímpar, o par é seu complemento
+            fib = np.asarray(fib_sequence, dtype=np.int64)
+            # (NUM_IMPAR é coluna gerada no banco, então só o bit par é gravado)
+            is_even = (fib & 1) ^ 1
+
+            # tolist() converte para int nativo, o único tipo inteiro que o sqlite3 sabe vincular
+            fib_values, even_values = fib.tolist(), is_even.tolist()
+
+            # 4. EXECUÇÃO DA QUERY EM LOTE
+            # UM ÚNICO STATEMENT PREPARADO EM UMA ÚNICA TRANSAÇÃO (COMMIT OU ROLLBACK);
+            # o executemany consome o zip diretamente, sem montar a lista de tuplas
+            with self._transaction():
+                self.conn.executemany(self._SQL_INSERT_TEST,
+                                      zip(repeat(candidate_id), fib_values, even_values))
+
+            # 5. DEBUG COMPLEMENTAR
+            # MOSTRA PRIMEIROS E ÚLTIMOS 5 REGISTROS (SÓ COM debug=True), EM UMA ÚNICA ESCRITA
+            if self.debug:
+                shown = list(zip(fib_values, even_values))
+                if len(shown) > 10:
+                    shown = shown[:5] + shown[-5:]
+                print("\n".join(f"  [SQL] INSERT INTO SELECAO_TESTE VALUES({candidate_id}, {f}, {p})"
+                                 for f, p in shown))
+
             # 6. FINALIZAÇÃO
-            self.conn.commit()
-            logging.debug(f" Commit realizado! {len(fib_sequence)} registros inseridos.")
-            logging.info(f"{len(fib_sequence)} testes inseridos")
+            log.debug(" Commit realizado! %s registros inseridos.", len(fib_sequence))
+            log.info("%s testes inseridos", len(fib_sequence))
         
         except sqlite3.Error as e:
             # 7. TRATAMENTO DE ERROS AVANÇADO
             # CAPTURA INFORMÇÕES ESPECÍFICAS DO SQLITE
             print(f"[ERRO CRÍTICO] Falha na inserção: {e}")
-            logging.error(f"Erro ao inserir testes: {e}")
+            log.error("Erro ao inserir testes: %s", e)
             
             # 7.1. DIAGNÓSTICO APRIMORADO
             if hasattr(e, 'sqlite_errorname'):
@@ -264,12 +390,28 @@ class DatabaseManager:
             List[Tuple]: Resultados da consulta ou lista vazia em caso de erro
         """
         try:
-            self.cursor.execute(query, params)  # Agora aceita parâmetros
-            return self.cursor.fetchall()
+            return self.conn.execute(query, params).fetchall()
         except sqlite3.Error as e:
-            logging.error(f"Erro na consulta '{query}': {e}")
+            log.error("Erro na consulta '%s': %s", query, e)
             return []
 
+    def execute_iter(self, query: str, params: tuple = ()) -> Iterator[Tuple]:
+        """Executa uma consulta SQL e entrega as linhas sob demanda, sem fetchall().
+        
+        Args:
+            query (str): Comando SQL a ser executado
+            params (tuple, optional): Parâmetros para a query. Defaults to ().
+        
+        Yields:
+            Tuple: Cada linha do resultado; nada é entregue em caso de erro
+        """
+        try:
+            # Cursor próprio: a iteração não é afetada por outras consultas,
+            # e o sqlite3 avança uma linha por vez (sqlite3_step) conforme o consumo
+            yield from self.conn.execute(query, params)
+        except sqlite3.Error as e:
+            log.error("Erro na consulta '%s': %s", query, e)
+
     def delete_large_numbers(self, threshold: int = 5000):
         """Remove números Fibonacci acima de um limite da tabela SELECAO_TESTE.
         
@@ -281,20 +423,27 @@ class DatabaseManager:
         """
         try:
             # 1.EXECUTA A EXCLUSÃO DOS REGISTROS
-            self.cursor.execute(
-                "DELETE FROM SELECAO_TESTE WHERE NUM_FIBONACCI > ?",
-                (threshold,)
-            )
-            
-            # 2.CONFIRMA A TRANSAÇÃO
-            self.conn.commit()
+            # 2.CONFIRMA A TRANSAÇÃO (COMMIT ao sair do bloco)
+            with self._transaction():
+                self.conn.execute(self._SQL_DELETE_LARGE, (threshold,))
             
             # 3.REGISTRA O LOG DE OPERAÇÃO
-            logging.info(f"Números acima de {threshold} removidos")
+            log.info("Números acima de %s removidos", threshold)
             
         except sqlite3.Error as e:
             # TRATAMENTO DE ERROS
-            logging.error(f"Erro ao deletar registros: {e}")
+            log.error("Erro ao deletar registros: %s", e)
+
+    def get_sequence(self, candidate_id: int) -> List[int]:
+        """Obtém apenas a sequência Fibonacci do candidato, em ordem crescente.
+        
+        Args:
+            candidate_id (int): ID do candidato para filtrar os dados
+            
+        Returns:
+            List[int]: Números Fibonacci gravados para o candidato
+        """
+        return [row[0] for row in self.execute_iter(self._SQL_SEQUENCE, (candidate_id,))]
 
     def get_stats(self, candidate_id: int) -> dict:
         """Obtém estatísticas completas do candidato e sua sequência Fibonacci.
@@ -303,45 +452,65 @@ class DatabaseManager:
             candidate_id (int): ID do candidato para filtrar os dados
             
         Returns:
-            dict: Dicionário contendo todas estatísticas calculadas
+            dict: Dicionário contendo todas estatísticas calculadas. O resultado é memorizado
+                até a próxima alteração no banco; cada chamada recebe uma cópia própria
         """
+        # 0. CACHE - nenhum COMMIT nem linha alterada desde o último cálculo
+        # (total_changes também cobre escritas em autocommit via execute_query/execute_iter)
+        version = (self._write_generation, self.conn.total_changes)
+        cached = self._stats_cache.get(candidate_id)
+        if cached is not None and cached[0] == version:
+            return self._copy_stats(cached[1])
+
         stats = {}
         
-        # 1. CONTAGEM TOTAL DE NÚMEROS
-        stats['total'] = self.execute_query(
-            "SELECT COUNT(*) FROM SELECAO_TESTE WHERE ID_CANDIDATO = ?",
-            (candidate_id,)
-        )[0][0]
-        
-        # 2. SEPARAÇÃO PARES/ÍMPARES
-        count_result = self.execute_query(
-            "SELECT SUM(NUM_PAR), SUM(NUM_IMPAR) FROM SELECAO_TESTE WHERE ID_CANDIDATO = ?",
-            (candidate_id,)
-        )[0]
-        stats['pares'] = count_result[0] or 0  # Evita None com fallback para 0
-        stats['impares'] = count_result[1] or 0
-        
-        # 3. SEQUÊNCIA COMPLETA ORDENADA
-        stats['sequencia'] = [row[0] for row in self.execute_query(
-            "SELECT NUM_FIBONACCI FROM SELECAO_TESTE WHERE ID_CANDIDATO = ? ORDER BY NUM_FIBONACCI",
-            (candidate_id,)
-        )]
-        
-        # 4. TOP 5 MAIORES NÚMEROS
-        stats['top5'] = [row[0] for row in self.execute_query(
-            "SELECT NUM_FIBONACCI FROM SELECAO_TESTE WHERE ID_CANDIDATO = ? ORDER BY NUM_FIBONACCI DESC LIMIT 5",
-            (candidate_id,)
-        )]
-        
-        # 5. DADOS CADASTRAIS DO CANDIDATO
-        stats['candidato'] = self.execute_query(
-            "SELECT NME_CANDIDATO, DAT_INSCRICAO FROM SELECAO_CANDIDATO WHERE ID_CANDIDATO = ?",
-            (candidate_id,)
+        # 1. CONTAGEM TOTAL E SEPARAÇÃO PARES/ÍMPARES (UMA ÚNICA VARREDURA)
+        # COUNT ... FILTER nunca retorna None, mesmo quando o candidato não tem testes
+        stats['total'], stats['pares'], stats['impares'] = self.execute_query(
+            self._SQL_COUNTS, (candidate_id,)
         )[0]
         
-        return stats
+        # 2. SEQUÊNCIA COMPLETA ORDENADA
+        stats['sequencia'] = self.get_sequence(candidate_id)
+        
+        # 3. TOP 5 MAIORES NÚMEROS
+        # A sequência já vem ordenada: basta inverter a cauda, sem uma segunda consulta
+        stats['top5'] = stats['sequencia'][-5:][::-1]
+        
+        # 4. DADOS CADASTRAIS DO CANDIDATO
+        stats['candidato'] = self.execute_query(self._SQL_CANDIDATE, (candidate_id,))[0]
+
+        self._stats_cache[candidate_id] = (version, stats)
+        return self._copy_stats(stats)
 
-    def validate_constraints(self) -> dict:
+    @staticmethod
+    def _copy_stats(stats: dict) -> dict:
+        """Cópia rasa do resultado memorizado, com listas próprias: o chamador pode alterá-la."""
+        return {**stats, 'sequencia': list(stats['sequencia']), 'top5': list(stats['top5'])}
+
+    def backup_to(self, db_path: str) -> bool:
+        """Copia o banco atual (ex: ':memory:') para um arquivo com a API de backup do SQLite.
+        
+        Args:
+            db_path (str): Caminho do arquivo de destino (substituído pelo conteúdo atual)
+            
+        Returns:
+            bool: True se a cópia foi concluída, False caso contrário
+        """
+        try:
+            dest = sqlite3.connect(db_path)
+            try:
+                # Cópia página a página em um único passo: uma só gravação em disco
+                self.conn.backup(dest)
+            finally:
+                dest.close()
+            log.info("Banco de dados salvo em %s", db_path)
+            return True
+        except sqlite3.Error as e:
+            log.error("Erro ao salvar banco de dados em %s: %s", db_path, e)
+            return False
+
+    def validate_constraints(self, deep: bool = False) -> dict:
         """Valida as restrições de integridade dos dados na tabela SELECAO_TESTE.
         
         Realiza verificações críticas para garantir a consistência dos dados:
@@ -349,6 +518,10 @@ class DatabaseManager:
         - Consistência entre campos de par e ímpar
         - Ausência de valores nulos em campos obrigatórios
         
+        Args:
+            deep (bool): Se True, sempre conta as violações de cada regra. Se False (padrão),
+                primeiro testa com EXISTS, que para na primeira violação, e só conta se houver alguma
+        
         Returns:
             dict: Relatório de validação contendo:
                 - invalid_par (int): Qtd de valores inválidos em NUM_PAR
@@ -359,38 +532,35 @@ class DatabaseManager:
         """
         try:
             # 1. CONSULTA DE VALIDAÇÃO
-            # Verifica conformidade dos dados com as regras de negócio
+            # Verifica conformidade dos dados com as regras de negócio:
+            # sem violações (o caso normal), o EXISTS basta e as contagens são todas zero
+            if not deep and not self.execute_query(self._SQL_ANY_INVALID)[0][0]:
+                invalid_par = invalid_impar = inconsistent_parity = null_values = 0
+            else:
+                # As quatro contagens saem de uma única varredura da tabela
+                invalid_par, invalid_impar, inconsistent_parity, null_values = self.execute_query(
+                    self._SQL_VALIDATE
+                )[0]
             results = {
-                'invalid_par': self.execute_query(
-                    "SELECT COUNT(*) FROM SELECAO_TESTE WHERE NUM_PAR NOT IN (0, 1)"
-                )[0][0],
-                
-                'invalid_impar': self.execute_query(
-                    "SELECT COUNT(*) FROM SELECAO_TESTE WHERE NUM_IMPAR NOT IN (0, 1)"
-                )[0][0],
-                
-                'inconsistent_parity': self.execute_query(
-                    "SELECT COUNT(*) FROM SELECAO_TESTE WHERE NUM_PAR = NUM_IMPAR"
-                )[0][0],
-                
-                'null_values': self.execute_query(
-                    "SELECT COUNT(*) FROM SELECAO_TESTE WHERE NUM_FIBONACCI IS NULL"
-                )[0][0]
+                'invalid_par': invalid_par,
+                'invalid_impar': invalid_impar,
+                'inconsistent_parity': inconsistent_parity,
+                'null_values': null_values
             }
 
             # 2. ANÁLISE DOS RESULTADOS
             # Avalia se foram encontradas inconsistências
             if any(results.values()):
-                logging.warning(f"Inconsistências detectadas: {results}")
+                log.warning("Inconsistências detectadas: %s", results)
             else:
-                logging.info("Dados validados com sucesso - nenhuma inconsistência encontrada")
+                log.info("Dados validados com sucesso - nenhuma inconsistência encontrada")
                 
             return results
             
         except Exception as e:
             # 3. TRATAMENTO DE FALHAS
             # Captura e registra erros durante o processo de validação
-            logging.error(f"Falha na validação: {str(e)}")
+            log.error("Falha na validação: %s", e)
             return {
                 'invalid_par': -1,
                 'invalid_impar': -1,
@@ -398,7 +568,7 @@ class DatabaseManager:
                 'null_values': -1
             }
 
-def add_section(pdf: FPDF, titulo: str, conteudo: str, font_style: str = '') -> None:
+def add_section(pdf: "FPDF", titulo: str, conteudo: str, font_style: str = '') -> None:
     """Adiciona uma seção formatada ao documento PDF.
 
     Args:
@@ -435,7 +605,165 @@ def add_section(pdf: FPDF, titulo: str, conteudo: str, font_style: str = '') ->
     # Adiciona pequeno espaçamento pós-seção
     pdf.ln(1)
 
-def create_bar_chart(labels: List[str], values: List[int], colors: List[str], total: int) -> BytesIO:
+# Resolução dos gráficos embutidos no PDF: 100 dpi basta para a largura impressa
+# e reduz a rasterização a menos da metade dos pixels de 150 dpi
+CHART_DPI = 100
+
+# Figura única reaproveitada pelos gráficos (criada na primeira utilização)
+_FIG = None
+
+def _get_figure(figsize: Tuple[float, float]):
+    """Retorna a figura compartilhada dos gráficos, limpa e com o tamanho pedido.
+
+    Args:
+        figsize (Tuple[float, float]): Largura e altura da figura em polegadas
+
+    Returns:
+        Figure: Figura do matplotlib pronta para receber um novo gráfico
+    """
+    global _FIG
+    if _FIG is None:
+        # Figura avulsa no canvas Agg: dispensa o pyplot e a seleção de backend gráfico
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        _FIG = Figure(figsize=figsize, dpi=CHART_DPI)
+        FigureCanvasAgg(_FIG)
+    else:
+        # Reaproveita a figura existente: só descarta os eixos e ajusta o tamanho
+        _FIG.clf()
+        _FIG.set_size_inches(figsize)
+    return _FIG
+
+def _render_figure(fig) -> "Image.Image":
+    """Rasteriza a figura no canvas Agg e devolve os pixels como imagem PIL (RGB).
+
+    O FPDF aceita a imagem PIL diretamente: evita codificar um PNG só para
+    o FPDF decodificá-lo em seguida.
+    """
+    from PIL import Image
+
+    fig.canvas.draw()
+    return Image.frombuffer('RGBA', fig.canvas.get_width_height(), fig.canvas.buffer_rgba(),
+                            'raw', 'RGBA', 0, 1).convert('RGB')
+
+def _hex_to_rgb(color: str) -> Tuple[int, int, int]:
+    """Converte uma cor '#rrggbb' para a tupla (r, g, b) usada pelo FPDF."""
+    color = color.lstrip('#')
+    return int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16)
+
+def draw_bar_chart(pdf: "FPDF", labels: List[str], values: List[int], colors: List[str], total: int,
+                   x: float = 10, w: float = 190, h: float = 60) -> None:
+    """Desenha o gráfico de barras par/ímpar direto no PDF, com primitivas do FPDF.
+
+    Alternativa ao create_bar_chart: não depende do matplotlib nem rasteriza imagem.
+
+    Args:
+        pdf (FPDF): Instância do objeto FPDF (o gráfico começa na posição Y atual)
+        labels (List[str]): Rótulos das barras (ex: ['Pares', 'Ímpares'])
+        values (List[int]): Valores correspondentes a cada categoria
+        colors (List[str]): Cores '#rrggbb' de cada barra
+        total (int): Valor total para cálculo de porcentagens
+        x (float, optional): Margem esquerda da área do gráfico em mm. Default: 10
+        w (float, optional): Largura da área do gráfico em mm. Default: 190
+        h (float, optional): Altura total (título, barras e rótulos) em mm. Default: 60
+    """
+    # 1. QUEBRA DE PÁGINA (rect/cell posicionados não disparam a quebra automática)
+    if pdf.get_y() + h > pdf.page_break_trigger:
+        pdf.add_page()
+    top = pdf.get_y()
+
+    # 2. TÍTULO
+    pdf.set_font("helvetica", style='B', size=10)
+    pdf.cell(0, 6, 'Distribuição Par/Ímpar na Sequência Fibonacci', align='C',
+             new_x="LMARGIN", new_y="NEXT")
+
+    # 3. GEOMETRIA: faixa de 6 mm acima das barras (valores) e abaixo (rótulos)
+    plot_top = top + 12
+    base_y = top + h - 6
+    plot_h = base_y - plot_top
+    max_value = max(values) or 1
+    slot = w / len(values)
+    bar_w = slot * 0.5
+
+    # 4. BARRAS E RÓTULOS
+    pdf.set_font("helvetica", size=9)
+    for i, (label, value, color) in enumerate(zip(labels, values, colors)):
+        bar_h = plot_h * value / max_value
+        slot_x = x + i * slot
+        pdf.set_fill_color(*_hex_to_rgb(color))
+        pdf.rect(slot_x + (slot - bar_w) / 2, base_y - bar_h, bar_w, bar_h, style='F')
+
+        percent = value / total * 100 if total else 0
+        pdf.set_xy(slot_x, base_y - bar_h - 5)
+        pdf.cell(slot, 5, f'{value} ({percent:.1f}%)', align='C')
+        pdf.set_xy(slot_x, base_y + 1)
+        pdf.cell(slot, 5, label, align='C')
+
+    # 5. EIXO E POSIÇÃO FINAL
+    pdf.set_draw_color(0, 0, 0)
+    pdf.line(x, base_y, x + w, base_y)
+    pdf.set_xy(pdf.l_margin, top + h)
+
+def draw_pie_chart(pdf: "FPDF", labels: List[str], sizes: List[int], colors: List[str],
+                   x: float = 50, w: float = 100, h: float = 80) -> None:
+    """Desenha o gráfico de setores par/ímpar direto no PDF, como vetor, com primitivas do FPDF.
+
+    Alternativa ao create_pie_chart: não depende do matplotlib nem rasteriza imagem.
+
+    Args:
+        pdf (FPDF): Instância do objeto FPDF (o gráfico começa na posição Y atual)
+        labels (List[str]): Nomes das categorias (ex: ['Pares', 'Ímpares'])
+        sizes (List[int]): Valores proporcionais para cada categoria
+        colors (List[str]): Cores '#rrggbb' de cada fatia
+        x (float, optional): Margem esquerda da área do gráfico em mm. Default: 50
+        w (float, optional): Largura da área do gráfico em mm. Default: 100
+        h (float, optional): Altura total (título e setores) em mm. Default: 80
+    """
+    import math
+
+    # 1. QUEBRA DE PÁGINA (primitivas posicionadas não disparam a quebra automática)
+    if pdf.get_y() + h > pdf.page_break_trigger:
+        pdf.add_page()
+    top = pdf.get_y()
+
+    # 2. TÍTULO
+    pdf.set_font("helvetica", style='B', size=10)
+    pdf.set_xy(x, top)
+    pdf.cell(w, 6, 'Distribuição Par/Ímpar em Gráfico de setores', align='C')
+
+    # 3. GEOMETRIA: círculo centralizado abaixo do título, com folga para os rótulos
+    radius = min(w, h - 12) / 2 - 6
+    cx, cy = x + w / 2, top + 10 + (h - 10) / 2
+    total = sum(sizes) or 1
+
+    # 4. FATIAS: a partir das 12h, no sentido anti-horário (como startangle=90 no matplotlib)
+    pdf.set_font("helvetica", size=9)
+    start = 90.0
+    for label, size, color in zip(labels, sizes, colors):
+        if not size:
+            continue
+        sweep = 360.0 * size / total
+        pdf.set_fill_color(*_hex_to_rgb(color))
+        if sweep >= 360.0:
+            pdf.circle(cx - radius, cy - radius, 2 * radius, style='F')
+        else:
+            # Os ângulos do FPDF seguem o eixo Y da página (para baixo): sentidos invertidos
+            pdf.solid_arc(cx - radius, cy - radius, 2 * radius, -(start + sweep), -start, style='F')
+
+        # Porcentagem dentro da fatia e rótulo fora dela, no ângulo médio
+        mid = math.radians(start + sweep / 2)
+        # Mesmo motivo: o seno entra com sinal invertido
+        for dist, text in ((0.6, f'{size / total * 100:.1f}%'), (1.25, label)):
+            tx = cx + dist * radius * math.cos(mid)
+            ty = cy - dist * radius * math.sin(mid)
+            pdf.set_xy(tx - 15, ty - 2.5)
+            pdf.cell(30, 5, text, align='C')
+        start += sweep
+
+    # 5. POSIÇÃO FINAL
+    pdf.set_xy(pdf.l_margin, top + h)
+
+def create_bar_chart(labels: List[str], values: List[int], colors: List[str], total: int) -> "Image.Image":
     """Gera um gráfico de barras com a distribuição de números pares/ímpares.
 
     Args:
@@ -445,25 +773,26 @@ def create_bar_chart(labels: List[str], values: List[int], colors: List[str], to
         total (int): Valor total para cálculo de porcentagens
 
     Returns:
-        BytesIO: Buffer contendo a imagem do gráfico em formato PNG
+        Image.Image: Imagem PIL (RGB) do gráfico, pronta para FPDF.image()
 
     Processo:
         - Configura tamanho e estilo do gráfico
         - Adiciona rótulos e valores percentuais
-        - Exporta para buffer de memória
+        - Rasteriza em memória, sem codificar PNG
     """
     # 1. CONFIGURAÇÃO INICIAL
-    plt.figure(figsize=(6, 2))
+    fig = _get_figure((6, 2))
+    ax = fig.add_subplot()
     
     # 2. CRIAÇÃO DAS BARRAS
-    bars = plt.bar(labels, values, color=colors)
-    plt.title('Distribuição Par/Ímpar na Sequência Fibonacci', pad=15)
-    plt.ylabel('Quantidade')
+    bars = ax.bar(labels, values, color=colors)
+    ax.set_title('Distribuição Par/Ímpar na Sequência Fibonacci', pad=15)
+    ax.set_ylabel('Quantidade')
     
     # 3. ADIÇÃO DE RÓTULOS
     for bar in bars:
         height = bar.get_height()
-        plt.text(
+        ax.text(
             bar.get_x() + bar.get_width() / 2,  # Posição X centralizada
             height + 0.5,                       # Posição Y acima da barra
             f'{height} ({height / total * 100:.1f}%)',  # Texto com valor e %
@@ -473,14 +802,11 @@ def create_bar_chart(labels: List[str], values: List[int], colors: List[str], to
         )
     
     # 4. EXPORTAÇÃO PARA MEMÓRIA
-    img_buffer = BytesIO()
-    plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-    img_buffer.seek(0)
-    plt.close()
-    
-    return img_buffer
+    # Margens fixas no lugar de bbox_inches='tight' (evita o segundo passe de renderização)
+    fig.subplots_adjust(left=0.1, right=0.98, bottom=0.15, top=0.78)
+    return _render_figure(fig)
 
-def create_pie_chart(labels: List[str], sizes: List[int], colors: List[str]) -> BytesIO:
+def create_pie_chart(labels: List[str], sizes: List[int], colors: List[str]) -> "Image.Image":
     """Gera um gráfico de pizza (setores) com distribuição de par/ímpar.
 
     Args:
@@ -489,45 +815,37 @@ def create_pie_chart(labels: List[str], sizes: List[int], colors: List[str]) ->
         colors (List[str]): Cores específicas para cada fatia
 
     Returns:
-        BytesIO: Buffer contendo a imagem do gráfico em formato PNG
+        Image.Image: Imagem PIL (RGB) do gráfico, pronta para FPDF.image()
 
     Processo:
         - Configura layout circular perfeito
         - Adiciona porcentagens automáticas
-        - Aplica efeito de sombra para melhor visualização
-        - Exporta para buffer de memória
+        - Rasteriza em memória, sem codificar PNG
     """
     # 1. CONFIGURAÇÃO DO GRÁFICO
-    plt.figure(figsize=(3, 3))  # Tamanho quadrado para gráfico circular
+    fig = _get_figure((4, 3.2))  # Folga lateral para título e rótulos sem bbox_inches='tight'
+    ax = fig.add_subplot()
     
     # 2. CRIAÇÃO DAS FATIAS
-    plt.pie(
+    ax.pie(
         sizes,
         labels=labels,
         colors=colors,
         autopct='%1.1f%%',  # Formatação automática de porcentagens
-        shadow=True,        # Efeito de profundidade
+        shadow=False,       # Sem sombra: evita composição alpha na rasterização
         startangle=90       # Rotação inicial (12h)
     )
     
     # 3. FORMATAÇÃO FINAL
-    plt.axis('equal')  # Garante proporção circular perfeita
-    plt.title('Distribuição Par/Ímpar em Gráfico de setores', pad=15)
+    ax.axis('equal')  # Garante proporção circular perfeita
+    ax.set_title('Distribuição Par/Ímpar em Gráfico de setores', pad=15)
     
     # 4. EXPORTAÇÃO PARA MEMÓRIA
-    img_buffer = BytesIO()
-    plt.savefig(
-        img_buffer,
-        format='png',
-        dpi=150,            # Resolução balanceada
-        bbox_inches='tight'  # Evita cortes
-    )
-    img_buffer.seek(0)
-    plt.close()
-    
-    return img_buffer
+    fig.subplots_adjust(left=0.15, right=0.85, bottom=0.04, top=0.86)  # Margens fixas, sem passe extra do bbox
+    return _render_figure(fig)
 
-def generate_report(stats: dict, execution_time: float, filename: str = "relatorio.pdf", expected_ratio: float = 1.618, tolerancia: float = 0.5):
+def generate_report(stats: dict, execution_time: float, filename: str = "relatorio.pdf", expected_ratio: float = 1.618, tolerancia: float = 0.5,
+                    chart_backend: str = "fpdf"):
     """Gera um relatório PDF com os resultados da análise da sequência Fibonacci.
     
     Args:
@@ -542,6 +860,8 @@ def generate_report(stats: dict, execution_time: float, filename: str = "relator
         filename (str, optional): Nome do arquivo PDF de saída. Padrão: "relatorio.pdf"
         expected_ratio (float, optional): Valor esperado da proporção áurea (ímpares/pares). Padrão: 1.618
         tolerancia (float, optional): Margem de aceitação para a proporção. Padrão: 0.5
+        chart_backend (str, optional): "fpdf" desenha os gráficos como vetores, com primitivas
+            do PDF; "mpl" usa as imagens geradas pelo matplotlib. Padrão: "fpdf"
     
     Returns:
         bool: True se o relatório foi gerado com sucesso, False caso contrário
@@ -558,6 +878,8 @@ def generate_report(stats: dict, execution_time: float, filename: str = "relator
         >>> generate_report(dados, "meu_relatorio.pdf", 1.6, 0.1)
     """
     try:
+        from fpdf import FPDF
+
         pdf = FPDF()
         pdf.add_page()
         pdf.set_auto_page_break(auto=True, margin=15)
@@ -579,25 +901,35 @@ def generate_report(stats: dict, execution_time: float, filename: str = "relator
         pdf.ln(4)
         
         # Sequência Fibonacci
-        fib_str = ', '.join(map(str, stats['sequencia']) ) 
+        # Converte só os números que cabem no limite de 300 caracteres exibidos:
+        # o restante da sequência nunca é formatado
+        fib_limit = 300
+        parts, fib_len = [], -2  # -2 desconta o separador antes do primeiro número
+        for text in map(str, stats['sequencia']):
+            if fib_len > fib_limit:
+                break
+            parts.append(text)
+            fib_len += len(text) + 2
+        fib_str = ', '.join(parts)
         pdf.set_font("helvetica", style='B', size=12)
-        pdf.cell(0, 10, f"Sequência Fibonacci ({len(stats['sequencia'])} números)", fib_str, new_x="LMARGIN", new_y="NEXT")
-        pdf.set_font_size(14)
-        pdf.set_font(style='B')
-        if len(fib_str) > 300:
-            fib_str = fib_str[:300] + '... [truncado]'
-        add_section(pdf, " ", f"{fib_str}", 'B')
+        pdf.cell(0, 10, f"Sequência Fibonacci ({len(stats['sequencia'])} números)", new_x="LMARGIN", new_y="NEXT")
+        # (add_section abaixo já define a fonte do conteúdo)
+        if len(fib_str) > fib_limit:
+            fib_str = fib_str[:fib_limit] + '... [truncado]'
+        add_section(pdf, " ", fib_str, 'B')
         pdf.ln(6)
 
         # Top 5 maiores números - formatação tabela simples
         add_section(pdf, "Top 5 Maiores Números", "", 'B')
         pdf.set_draw_color(150, 150, 150)
         pdf.set_fill_color(220, 220, 220)
-        pdf.cell(40, 8, "Posição", border=1, fill=True, align='C', new_x="RIGHT", new_y="TOP")
-        pdf.cell(40, 8, "Valor", border=1, fill=True, align='C', new_x="LMARGIN", new_y="NEXT")
+        # Estilo da tabela definido uma única vez; no laço, "cell" evita a busca de atributo por linha
+        cell = pdf.cell
+        cell(40, 8, "Posição", border=1, fill=True, align='C', new_x="RIGHT", new_y="TOP")
+        cell(40, 8, "Valor", border=1, fill=True, align='C', new_x="LMARGIN", new_y="NEXT")
         for i, num in enumerate(stats['top5'], 1):
-            pdf.cell(40, 8, str(i), border=1, align='C', new_x="RIGHT", new_y="TOP")
-            pdf.cell(40, 8, f"{num:,}", border=1, align='C', new_x="LMARGIN", new_y="NEXT")
+            cell(40, 8, str(i), border=1, align='C', new_x="RIGHT", new_y="TOP")
+            cell(40, 8, f"{num:,}", border=1, align='C', new_x="LMARGIN", new_y="NEXT")
         pdf.ln(10)
 
         # Análise Estatística + Gráficos
@@ -606,13 +938,21 @@ def generate_report(stats: dict, execution_time: float, filename: str = "relator
         labels = ['Pares', 'Ímpares']
         values = [stats['pares'], stats['impares']]
         colors_bar = ['#4e79a7', '#f28e2b']
-        img_bar = create_bar_chart(labels, values, colors_bar, stats['total'])
-        pdf.image(img_bar, x=10, w=190)
+        if chart_backend == "mpl":
+            img_bar = create_bar_chart(labels, values, colors_bar, stats['total'])
+            pdf.image(img_bar, x=10, w=190)
+            img_bar.close()  # O FPDF já leu a imagem; libera os pixels da memória
+        else:
+            draw_bar_chart(pdf, labels, values, colors_bar, stats['total'])
         pdf.ln(10)
 
         colors_pie = ['#66c2a5', '#fc8d62']
-        img_pie = create_pie_chart(labels, values, colors_pie)
-        pdf.image(img_pie, x=50, w=100)
+        if chart_backend == "mpl":
+            img_pie = create_pie_chart(labels, values, colors_pie)
+            pdf.image(img_pie, x=50, w=100)
+            img_pie.close()
+        else:
+            draw_pie_chart(pdf, labels, values, colors_pie)
         pdf.ln(10)
 
         # Análise Matemática da proporção
@@ -647,16 +987,16 @@ def generate_report(stats: dict, execution_time: float, filename: str = "relator
         pdf.cell(0, 5, "Todos os direitos reservados © 2025",
                  new_x="LMARGIN", new_y="NEXT", align='C')
 
-        pdf.output(filename)
-        logging.info(f"Relatório gerado: {filename}")
-        return True
-
-        pdf.output(filename)
-        logging.info(f"Relatório gerado: {filename}")
+        # Grava direto no arquivo aberto e descarta o documento em seguida,
+        # liberando páginas, imagens e o buffer serializado do FPDF
+        with open(filename, "wb") as fh:
+            pdf.output(fh)
+        pdf = None
+        log.info("Relatório gerado: %s", filename)
         return True
     # Captura e registra qualquer erro durante a geração do relatório
     except Exception as e:
-        logging.error(f"Erro ao gerar relatório: {e}")
+        log.error("Erro ao gerar relatório: %s", e)
         return False
 
 def export_stats_to_json(stats: Dict[str, Any], filename: str = "dados.json"):
@@ -670,18 +1010,30 @@ def export_stats_to_json(stats: Dict[str, Any], filename: str = "dados.json"):
         bool: True se exportado com sucesso, False se falhar
     """
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(stats, f, ensure_ascii=False, indent=4, default=str)
-        logging.info(f"Dados exportados para JSON: {filename}")
+        try:
+            # orjson (opcional) serializa direto para bytes UTF-8, bem mais rápido que o json
+            import orjson
+            data = orjson.dumps(stats, default=str,
+                                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        except ImportError:
+            # Mesmo formato com a biblioteca padrão, codificado de uma vez e gravado em uma escrita
+            data = json.dumps(stats, ensure_ascii=False, indent=2, default=str).encode('utf-8')
+        with open(filename, 'wb') as f:
+            f.write(data)
+        log.info("Dados exportados para JSON: %s", filename)
         return True
     except Exception as e:
-        logging.error(f"Erro ao exportar JSON: {e}") 
+        log.error("Erro ao exportar JSON: %s", e) 
         return False
 
 def run_full_process(candidate_name: str,
                      expected_ratio: float = 1.618,
                      tolerancia: float = 0.5,
-                     export_json: bool = False):
+                     export_json: bool = False,
+                     make_report: bool = True,
+                     chart_backend: str = "fpdf",
+                     in_memory: bool = False,
+                     debug: bool = False):
     """
     Executa o fluxo completo do processo seletivo: cria o banco, insere dados,
     executa consultas, deleta registros e gera relatórios, medindo o tempo total.
@@ -691,24 +1043,29 @@ def run_full_process(candidate_name: str,
         expected_ratio (float): Valor esperado da proporção áurea (padrão: 1.618).
         tolerancia (float): Margem aceitável para validação (padrão: 0.5).
         export_json (bool): Se True, exporta os dados para JSON (padrão: False).
+        make_report (bool): Se False, pula a geração do PDF, a etapa mais cara (padrão: True).
+        chart_backend (str): Como desenhar os gráficos: "fpdf" ou "mpl" (padrão: "fpdf").
+        in_memory (bool): Se True, processa em um banco ':memory:' e grava selecao.db
+            uma única vez ao final (padrão: False).
+        debug (bool): Se True, imprime amostra dos registros inseridos (padrão: False).
     """
     # 1. INICIALIZAÇÃO E MEDIÇÃO DE TEMPO
     start_time = time.perf_counter()
-    logging.info("=" * 50)
-    logging.info(f"INICIANDO PROCESSO SELETIVO PARA: {candidate_name}")
-    logging.info("=" * 50)
+    log.info("=" * 50)
+    log.info("INICIANDO PROCESSO SELETIVO PARA: %s", candidate_name)
+    log.info("=" * 50)
 
     try:
-        db = DatabaseManager()
+        db = DatabaseManager(':memory:' if in_memory else 'selecao.db', debug=debug)
 
         # 2. PREPARAÇÃO DO BANCO DE DADOS E INSERÇÃO
         if not db.create_tables():
-            logging.error("Processo abortado devido a falha na criação das tabelas.")
+            log.error("Processo abortado devido a falha na criação das tabelas.")
             return
 
         candidate_id = db.insert_candidate(candidate_name)
         if candidate_id == -1:
-            logging.error("Processo abortado devido a falha ao inserir candidato.")
+            log.error("Processo abortado devido a falha ao inserir candidato.")
             return
 
         fib_sequence = db.generate_fibonacci(30) # Gera os 30 números pedidos
@@ -718,7 +1075,7 @@ def run_full_process(candidate_name: str,
         db.validate_constraints()
 
         # 3. CONSULTAS SQL (ANTES DA EXCLUSÃO)
-        logging.info("Executando consultas SQL obrigatórias (antes da exclusão)...")
+        log.info("Executando consultas SQL obrigatórias (antes da exclusão)...")
         stats_before = db.get_stats(candidate_id)
         
         print("\n" + "-"*20 + " RESULTADOS ANTES DA EXCLUSÃO " + "-"*20)
@@ -738,49 +1095,55 @@ def run_full_process(candidate_name: str,
 
         # 4. OPERAÇÃO DE EXCLUSÃO
         delete_threshold = 5000
-        logging.info(f"[OPERAÇÃO] Deletando todos os números maiores que {delete_threshold}...")
+        log.info("[OPERAÇÃO] Deletando todos os números maiores que %s...", delete_threshold)
         db.delete_large_numbers(threshold=delete_threshold)
-        logging.info("Deleção concluída com sucesso.")
+        log.info("Deleção concluída com sucesso.")
 
         # 5. CONSULTA SQL (APÓS A EXCLUSÃO)
-        logging.info("Executando consultas SQL obrigatórias (após a exclusão)...")
-        stats_after = db.get_stats(candidate_id)
+        # Só a sequência remanescente é exibida; as demais estatísticas já vêm de stats_before
+        log.info("Executando consultas SQL obrigatórias (após a exclusão)...")
+        sequence_after = db.get_sequence(candidate_id)
         
         print("\n" + "-"*20 + " RESULTADOS APÓS A EXCLUSÃO " + "-"*21)
         # d) Listar a sequência Fibonacci novamente
         print(f"\n[CONSULTA 4] Sequência Fibonacci remanescente (números <= {delete_threshold}):")
-        print(', '.join(map(str, stats_after['sequencia'])))
+        print(', '.join(map(str, sequence_after)))
         print("-" * 64 + "\n")
 
+        # Banco em memória: persiste o resultado final em disco de uma só vez
+        if in_memory:
+            db.backup_to('selecao.db')
 
     except Exception as e:
-        logging.critical(f"Ocorreu um erro fatal durante a execução: {e}")
+        log.critical("Ocorreu um erro fatal durante a execução: %s", e)
 
     finally:
         # 6. FINALIZAÇÃO E RELATÓRIOS
         end_time = time.perf_counter()
         duration = end_time - start_time
 
-        logging.info("=" * 50)
-        logging.info("PROCESSO FINALIZADO")
-        logging.info(f"Tempo de execução total: {duration:.4f} segundos.")
-        logging.info("=" * 50)
+        log.info("=" * 50)
+        log.info("PROCESSO FINALIZADO")
+        log.info("Tempo de execução total: %.4f segundos.", duration)
+        log.info("=" * 50)
 
         # Gera os relatórios com base nos dados de antes da exclusão, que são mais completos,
         # mas adiciona o tempo total de execução de todo o processo.
         if 'stats_before' in locals():
-            logging.info("Gerando relatório em PDF...")
-            generate_report(stats_before, 
-                            duration, 
-                            filename="relatorio.pdf",
-                            expected_ratio=expected_ratio, 
-                            tolerancia=tolerancia)
+            if make_report:
+                log.info("Gerando relatório em PDF...")
+                generate_report(stats_before, 
+                                duration, 
+                                filename="relatorio.pdf",
+                                expected_ratio=expected_ratio, 
+                                tolerancia=tolerancia,
+                                chart_backend=chart_backend)
 
             if export_json:
-                logging.info("Exportando dados para JSON...")
+                log.info("Exportando dados para JSON...")
                 export_stats_to_json(stats_before, filename="dados_finais.json")
         else:
-            logging.warning("Não foi possível gerar relatórios pois os dados iniciais não foram coletados.")
+            log.warning("Não foi possível gerar relatórios pois os dados iniciais não foram coletados.")
 
 def test_fibonacci_generation():
     """Testa a geração da sequência Fibonacci
@@ -793,14 +1156,15 @@ def test_fibonacci_generation():
     - ❌ Falha no teste (com diferenças) se houver erro
     """
     try:
-        # 1. Prepara teste
-        db = DatabaseManager()      
+        # 1. Prepara teste (geração é estática: nenhum banco é aberto)
         # 2. Gera sequência (10 primeiros números)
-        sequence = db.generate_fibonacci(10)       
+        sequence = DatabaseManager.generate_fibonacci(10)       
         # 3. Define resultado esperado
         expected = [1, 1, 2, 3, 5, 8, 13, 21, 34, 55]       
         # 4. Compara resultados
-        assert sequence == expected, f"Esperado {expected}, obtido {sequence}"        
+        assert sequence.tolist() == expected, f"Esperado {expected}, obtido {sequence}"        
+        # 5. Confere o termo isolado por fast doubling com o último da sequência
+        assert DatabaseManager.fib_single(10) == expected[-1], f"fib_single(10) deveria ser {expected[-1]}"
         print("✅ Teste de Fibonacci aprovado!")
         
     except AssertionError as e:
@@ -818,6 +1182,8 @@ if __name__ == "__main__":
             * Exibição de ajuda
     """
     # 1. DEFINIÇÃO DOS ARGUMENTOS
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Sistema de Processo Seletivo SEFAZ/ES",
         epilog="Desenvolvido para a vaga de programador Python"
@@ -844,9 +1210,28 @@ if __name__ == "__main__":
     parser.add_argument('--export_json',
                       action='store_true',
                       help="Gera arquivo JSON com os resultados da análise")
+    parser.add_argument('--no_report',
+                      action='store_true',
+                      help="Não gera o relatório PDF (execução mais rápida)")
+    parser.add_argument('--quiet',
+                      action='store_true',
+                      help="Registra apenas avisos e erros no log")
+    parser.add_argument('--chart',
+                      choices=['fpdf', 'mpl'],
+                      default='fpdf',
+                      help="Gráficos: primitivas do PDF ou matplotlib (default: fpdf)")
+    parser.add_argument('--in_memory',
+                      action='store_true',
+                      help="Processa em memória e grava selecao.db apenas ao final")
+    parser.add_argument('--debug',
+                      action='store_true',
+                      help="Imprime os primeiros e últimos registros inseridos")
     
     # 2. PROCESSAMENTO DOS ARGUMENTOS
     args = parser.parse_args()
+
+    # Modo silencioso: eleva o nível do logger raiz, descartando as mensagens INFO
+    logging.getLogger().setLevel(logging.WARNING if args.quiet else logging.INFO)
     
     # 3. ROTEAMENTO DA EXECUÇÃO
     if args.testar:
@@ -860,7 +1245,11 @@ if __name__ == "__main__":
             args.nome,
             args.expected_ratio,
             args.tolerancia,
-            args.export_json
+            args.export_json,
+            make_report=not args.no_report,
+            chart_backend=args.chart,
+            in_memory=args.in_memory,
+            debug=args.debug
         )
         
     else:
@@ -871,5 +1260,10 @@ if __name__ == "__main__":
         print("  --expected_ratio FLOAT : Ajusta proporção áurea esperada")
         print("  --tolerancia FLOAT     : Define margem de aceitação")
         print("  --export_json          : Exporta dados para arquivo JSON")
+        print("  --no_report            : Não gera o relatório PDF")
+        print("  --quiet                : Registra apenas avisos e erros")
+        print("  --chart {fpdf,mpl}     : Escolhe como desenhar os gráficos")
+        print("  --in_memory            : Processa em memória e grava o banco só ao final")
+        print("  --debug                : Imprime amostra dos registros inseridos")
         print("\nExemplo completo:")
         print("  python selecao.py --nome \"Maria Silva\" --tolerancia 0.3 --export_json")
\ No newline at end of file